@@ -4,58 +4,13 @@
  */
 
 import { useCallback, useRef } from 'react';
-import { fs } from '../lib/cep/node';
+import { fs, child_process, os } from '../lib/cep/node';
+import { fsAsync } from '../lib/fs-async';
 import { errorManager, ErrorUtils, ErrorCategory, ErrorSeverity } from '../lib/error-manager';
 import { SecurityValidator, InputSanitizer } from '../lib/security-manager';
 import type { SFXState, SFXFileInfo, SFXAction } from '../lib/state-manager';
 import { SFXActions } from '../lib/state-manager';
 
-// Async file system utilities
-const fsAsync = {
-  exists: async (path: string): Promise<boolean> => {
-    return new Promise((resolve) => {
-      try {
-        resolve(fs.existsSync(path));
-      } catch {
-        resolve(false);
-      }
-    });
-  },
-  
-  readdir: async (path: string): Promise<string[]> => {
-    return new Promise((resolve, reject) => {
-      try {
-        const items = fs.readdirSync(path);
-        resolve(items);
-      } catch (error) {
-        reject(error);
-      }
-    });
-  },
-  
-  stat: async (path: string): Promise<any> => {
-    return new Promise((resolve, reject) => {
-      try {
-        const stats = fs.statSync(path);
-        resolve(stats);
-      } catch (error) {
-        reject(error);
-      }
-    });
-  },
-  
-  mkdir: async (path: string, options?: { recursive?: boolean }): Promise<void> => {
-    return new Promise((resolve, reject) => {
-      try {
-        fs.mkdirSync(path, options);
-        resolve();
-      } catch (error) {
-        reject(error);
-      }
-    });
-  }
-};
-
 interface UseSFXFileManagerProps {
   state: SFXState;
   dispatch: React.Dispatch<SFXAction>;
@@ -68,14 +23,14 @@ export const useSFXFileManager = ({ state, dispatch }: UseSFXFileManagerProps) =
   /**
    * Parse SFX filename to extract metadata
    */
-  const parseSFXFilename = useCallback((filename: string, fullPath: string, source: 'filesystem' | 'project_bin' = 'filesystem'): SFXFileInfo => {
+  const parseSFXFilename = useCallback((filename: string, fullPath: string, source: 'filesystem' | 'project_bin' = 'filesystem', mtime?: Date): SFXFileInfo => {
     const basename = filename.replace(/\.[^/.]+$/, ''); // Remove extension
     const parts = basename.split('_');
-    
+
     // Try to extract number and prompt from filename
     let number = 0;
     let prompt = basename;
-    
+
     if (parts.length >= 2) {
       const lastPart = parts[parts.length - 1];
       const numberMatch = lastPart.match(/(\d+)$/);
@@ -84,16 +39,21 @@ export const useSFXFileManager = ({ state, dispatch }: UseSFXFileManagerProps) =
         prompt = parts.slice(0, -1).join('_');
       }
     }
-    
-    // Get file stats for timestamp
+
+    // Get file stats for timestamp (callers that already stat'ed the file
+    // pass mtime in so the scan doesn't stat twice)
     let timestamp = '';
-    try {
-      const stats = fs.statSync(fullPath);
-      timestamp = stats.mtime.toISOString();
-    } catch (error) {
-      timestamp = new Date().toISOString();
+    if (mtime) {
+      timestamp = mtime.toISOString();
+    } else {
+      try {
+        const stats = fs.statSync(fullPath);
+        timestamp = stats.mtime.toISOString();
+      } catch (error) {
+        timestamp = new Date().toISOString();
+      }
     }
-    
+
     return {
       filename,
       basename,
@@ -195,15 +155,26 @@ export const useSFXFileManager = ({ state, dispatch }: UseSFXFileManagerProps) =
         /\.(mp3|wav|m4a|aac|flac|ogg)$/i.test(file)
       );
 
+      // Stat all files concurrently and feed the mtimes into the parser,
+      // instead of letting each parseSFXFilename call stat synchronously
       const fileInfoPromises = audioFiles.map(async (filename) => {
         const fullPath = `${sfxPath}/${filename}`;
-        return parseSFXFilename(filename, fullPath);
+        let mtime: Date | undefined;
+        try {
+          const stats = await fsAsync.stat(fullPath);
+          mtime = stats.mtime;
+        } catch {
+          // parseSFXFilename falls back to the current time
+        }
+        return parseSFXFilename(filename, fullPath, 'filesystem', mtime);
       });
 
       const fileInfo = await Promise.all(fileInfoPromises);
       
-      // Sort by timestamp (newest first)
-      fileInfo.sort((a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime());
+      // Sort by timestamp (newest first) - parse each timestamp once up
+      // front rather than allocating two Date objects per comparison
+      const mtimeMs = new Map(fileInfo.map(info => [info, new Date(info.timestamp).getTime()]));
+      fileInfo.sort((a, b) => mtimeMs.get(b)! - mtimeMs.get(a)!);
 
       // Update cache
       cachedFileInfoRef.current = fileInfo;
@@ -287,24 +258,22 @@ export const useSFXFileManager = ({ state, dispatch }: UseSFXFileManagerProps) =
         return;
       }
 
-      // Use system command to open folder
-      const { exec } = require('child_process');
-      const platform = require('os').platform();
-      
-      let command: string;
-      switch (platform) {
+      // Use system command to open folder - execFile skips the shell, so
+      // quotes or $() in the folder path can't be interpreted as commands
+      let opener: string;
+      switch (os.platform()) {
         case 'darwin': // macOS
-          command = `open "${sfxPath}"`;
+          opener = 'open';
           break;
         case 'win32': // Windows
-          command = `explorer "${sfxPath}"`;
+          opener = 'explorer';
           break;
         default: // Linux
-          command = `xdg-open "${sfxPath}"`;
+          opener = 'xdg-open';
           break;
       }
 
-      exec(command, (error: any) => {
+      child_process.execFile(opener, [sfxPath], (error: any) => {
         if (error) {
           ErrorUtils.handleFileError(error as Error, { operation: 'openSFXFolder' });
         } else {
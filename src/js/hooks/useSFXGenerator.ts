@@ -4,6 +4,7 @@
  */
 
 import { useCallback, useRef } from 'react';
+import { fs } from '../lib/cep/node';
 import { errorManager, ErrorUtils, ErrorCategory, ErrorSeverity } from '../lib/error-manager';
 import { SecurityManager, SecurityValidator, InputSanitizer } from '../lib/security-manager';
 import { bridgeClient } from '../lib/bridge-client';
@@ -98,9 +99,8 @@ export const useSFXGenerator = ({
     do {
       filename = generateSFXFilename(basePrompt, index);
       const fullPath = `${sfxPath}/${filename}`;
-      
+
       // Check if file exists
-      const { fs } = require('../lib/cep/node');
       if (!fs.existsSync(fullPath)) {
         break;
       }
@@ -188,8 +188,7 @@ export const useSFXGenerator = ({
       }
 
       const fullPath = `${sfxPath}/${filename}`;
-      const { fs } = require('../lib/cep/node');
-      
+
       // Convert ArrayBuffer to Buffer
       const buffer = Buffer.from(audioData);
       
@@ -312,8 +311,11 @@ export const useSFXGenerator = ({
         await placeSFXInTimeline(filePath, options);
       }
 
-      // Refresh file list
-      await scanSFXFiles(true);
+      // Refresh file list in the background - the generated file is already
+      // saved and placed, so success shouldn't wait on a full rescan
+      scanSFXFiles(true).catch(() => {
+        // Scan failures surface through the file manager's own error handling
+      });
 
       errorManager.success('SFX generated successfully!');
       return filePath;
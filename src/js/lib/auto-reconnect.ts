@@ -9,14 +9,17 @@ export function initAutoReconnect() {
     return;
   }
 
+  // One regex over textContent instead of two innerHTML scans - innerHTML
+  // re-serializes the whole DOM per call, textContent is a cheap tree walk
+  const ERROR_TEXT_PATTERN = /ERR_CONNECTION_REFUSED|Failed to fetch/;
+
   // Check if page failed to load - improved detection
   const checkPageError = () => {
     // Only trigger if we're actually on an error page
     const isErrorPage = (
-      document.title === 'Page failed to load' || 
-      document.body?.innerHTML?.includes('ERR_CONNECTION_REFUSED') ||
-      document.body?.innerHTML?.includes('Failed to fetch')
-    ) && 
+      document.title === 'Page failed to load' ||
+      ERROR_TEXT_PATTERN.test(document.body?.textContent || '')
+    ) &&
     // Prevent false positives on normal pages
     !document.querySelector('[data-plugin="ai-sfx"]') &&
     !document.querySelector('.plugin-container');
@@ -30,11 +33,19 @@ export function initAutoReconnect() {
   const handleConnectionError = () => {
     const targetUrl = window.location.href;
     let attempts = 0;
-    const maxAttempts = 120; // 2 minutes
-    
+    const deadline = Date.now() + 120000; // 2 minutes
+    let retryDelay = 100; // Start fast, back off below
+
     const tryConnect = () => {
       attempts++;
-      
+
+      // Update the counter from the retry itself instead of a separate
+      // 1s interval that would keep ticking after we stop probing
+      const counter = document.getElementById('attempt-counter');
+      if (counter) {
+        counter.textContent = `Attempt ${attempts}`;
+      }
+
       // Try to fetch from dev server
       fetch(targetUrl.replace(/^http/, 'http'), { method: 'HEAD', mode: 'no-cors' })
         .then(() => {
@@ -43,8 +54,11 @@ export function initAutoReconnect() {
           }, 500);
         })
         .catch(() => {
-          if (attempts < maxAttempts) {
-            setTimeout(tryConnect, 1000);
+          if (Date.now() < deadline) {
+            // Exponential backoff (100ms → 2s cap) - catches fast server
+            // boots quickly without hammering a server that's still down
+            setTimeout(tryConnect, retryDelay);
+            retryDelay = Math.min(retryDelay * 2, 2000);
           } else {
             showManualInstructions();
           }
@@ -75,14 +89,6 @@ export function initAutoReconnect() {
           </div>
         </div>
       `;
-      
-      // Update attempt counter
-      setInterval(() => {
-        const counter = document.getElementById('attempt-counter');
-        if (counter) {
-          counter.textContent = `Attempt ${attempts}`;
-        }
-      }, 1000);
     }
   };
 
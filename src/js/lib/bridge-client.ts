@@ -29,9 +29,19 @@ export class AIsfxBridgeClient {
   private debug: boolean;
   private messageHandlers = new Map<string, Function[]>();
   private connectionId: string | null = null;
+  private pendingRequests = new Map<string, {
+    resolve: (message: BridgeMessage) => void;
+    reject: (error: Error) => void;
+    timer: ReturnType<typeof setTimeout>;
+  }>();
+  private requestCounter = 0;
+  private outboundQueue: BridgeMessage[] = [];
+  private maxQueuedMessages = 100;
 
   constructor(options: BridgeOptions = {}) {
-    this.url = options.url || 'ws://localhost:8090';
+    // Pin the loopback IP instead of 'localhost' - skips per-connect name
+    // resolution and IPv6 (::1) fallback attempts on some macOS configs
+    this.url = options.url || 'ws://127.0.0.1:8090';
     this.autoReconnect = options.autoReconnect !== false;
     this.reconnectInterval = options.reconnectInterval || 2000;
     this.maxReconnectAttempts = options.maxReconnectAttempts || 30;
@@ -60,6 +70,7 @@ export class AIsfxBridgeClient {
         this.reconnectAttempts = 0;
         this.log('✅ Connected to bridge server');
         this.register();
+        this.flushOutboundQueue();
       };
 
       this.ws.onmessage = (event) => {
@@ -70,8 +81,9 @@ export class AIsfxBridgeClient {
         this.isConnected = false;
         this.isRegistered = false;
         this.connectionId = null;
+        this.failPendingRequests('Connection closed');
         this.log('❌ Disconnected from bridge server');
-        
+
         if (this.autoReconnect && this.reconnectAttempts < this.maxReconnectAttempts) {
           this.scheduleReconnect();
         }
@@ -82,18 +94,21 @@ export class AIsfxBridgeClient {
         this.log('❌ WebSocket error:', error);
       };
 
-      // Wait for connection
+      // Wait for connection - resolved by the socket events themselves
+      // (no 100ms polling), with a single deadline timer as a backstop
       return new Promise((resolve) => {
-        const checkConnection = () => {
-          if (this.isConnected) {
-            resolve(true);
-          } else if (!this.isConnecting) {
-            resolve(false);
-          } else {
-            setTimeout(checkConnection, 100);
-          }
+        const ws = this.ws!;
+        let settled = false;
+        const settle = (connected: boolean) => {
+          if (settled) return;
+          settled = true;
+          clearTimeout(deadline);
+          resolve(connected);
         };
-        setTimeout(checkConnection, 100);
+        const deadline = setTimeout(() => settle(this.isConnected), 10000);
+        ws.addEventListener('open', () => settle(true), { once: true });
+        ws.addEventListener('close', () => settle(false), { once: true });
+        ws.addEventListener('error', () => settle(false), { once: true });
       });
 
     } catch (error) {
@@ -136,6 +151,16 @@ export class AIsfxBridgeClient {
       const message: BridgeMessage = JSON.parse(data);
       this.log('📨 Received:', message.type);
 
+      // Resolve any in-flight request() waiting on this reply first,
+      // so concurrent requests can't steal each other's responses
+      if (message.requestId && this.pendingRequests.has(message.requestId)) {
+        const pending = this.pendingRequests.get(message.requestId)!;
+        this.pendingRequests.delete(message.requestId);
+        clearTimeout(pending.timer);
+        pending.resolve(message);
+        return;
+      }
+
       // Handle system messages
       switch (message.type) {
         case 'welcome':
@@ -174,7 +199,12 @@ export class AIsfxBridgeClient {
    */
   send(message: BridgeMessage): boolean {
     if (!this.isConnected || !this.ws) {
-      this.log('⚠️ Cannot send message: not connected');
+      // Queue instead of dropping - flushed in-order once the socket opens
+      if (this.outboundQueue.length >= this.maxQueuedMessages) {
+        this.outboundQueue.shift();
+      }
+      this.outboundQueue.push(message);
+      this.log(`⏳ Not connected, queued message (${this.outboundQueue.length} pending)`);
       return false;
     }
 
@@ -188,6 +218,50 @@ export class AIsfxBridgeClient {
     }
   }
 
+  /**
+   * Flush messages queued while disconnected
+   */
+  private flushOutboundQueue() {
+    if (this.outboundQueue.length === 0) return;
+    const queued = this.outboundQueue;
+    this.outboundQueue = [];
+    this.log(`📤 Flushing ${queued.length} queued message(s)`);
+    queued.forEach(message => this.send(message));
+  }
+
+  /**
+   * Send message and wait for the matching response
+   * Tags the message with a unique requestId and resolves when the server
+   * replies with the same id, so multiple requests can be in flight at once.
+   * Unlike send(), requests are never queued while disconnected: the caller
+   * is waiting on a reply, so a late flush would execute a request whose
+   * caller was already told it failed. Fail fast instead.
+   */
+  request(message: BridgeMessage, timeoutMs = 10000): Promise<BridgeMessage> {
+    const requestId = message.requestId || `req-${Date.now()}-${++this.requestCounter}`;
+
+    return new Promise((resolve, reject) => {
+      if (!this.isConnected || !this.ws) {
+        reject(new Error('Cannot send request: not connected'));
+        return;
+      }
+
+      const timer = setTimeout(() => {
+        this.pendingRequests.delete(requestId);
+        reject(new Error(`Request ${requestId} timed out after ${timeoutMs}ms`));
+      }, timeoutMs);
+
+      this.pendingRequests.set(requestId, { resolve, reject, timer });
+
+      if (!this.send({ ...message, requestId })) {
+        // Send failed on a live socket (serialization/socket error)
+        this.pendingRequests.delete(requestId);
+        clearTimeout(timer);
+        reject(new Error('Cannot send request: send failed'));
+      }
+    });
+  }
+
   /**
    * Send console message to multi-plugin debugger
    */
@@ -283,17 +357,34 @@ export class AIsfxBridgeClient {
   }
 
   /**
-   * Schedule reconnection attempt
+   * Reject all in-flight requests (connection lost or closing)
+   */
+  private failPendingRequests(reason: string) {
+    this.pendingRequests.forEach((pending) => {
+      clearTimeout(pending.timer);
+      pending.reject(new Error(reason));
+    });
+    this.pendingRequests.clear();
+  }
+
+  /**
+   * Schedule reconnection attempt with exponential backoff
+   * Starts at the configured interval and doubles per attempt (30s cap),
+   * so a down bridge server isn't hammered at a fixed rate
    */
   private scheduleReconnect() {
     this.reconnectAttempts++;
-    this.log(`⏳ Scheduling reconnect attempt ${this.reconnectAttempts}/${this.maxReconnectAttempts}`);
-    
+    const delay = Math.min(
+      this.reconnectInterval * Math.pow(2, this.reconnectAttempts - 1),
+      30000
+    );
+    this.log(`⏳ Scheduling reconnect attempt ${this.reconnectAttempts}/${this.maxReconnectAttempts} in ${delay}ms`);
+
     setTimeout(() => {
       if (!this.isConnected) {
         this.connect();
       }
-    }, this.reconnectInterval);
+    }, delay);
   }
 
   /**
@@ -41,6 +41,47 @@ export interface NotificationOptions {
   };
 }
 
+// Default user-facing messages per category/severity - built once at module
+// load instead of re-allocating the whole table on every handled error
+const DEFAULT_USER_MESSAGES: Record<ErrorCategory, Record<ErrorSeverity, string>> = {
+  [ErrorCategory.FILE_SYSTEM]: {
+    [ErrorSeverity.LOW]: 'File operation completed with warnings',
+    [ErrorSeverity.MEDIUM]: 'File access issue - please check permissions',
+    [ErrorSeverity.HIGH]: 'Unable to access file system - check folder permissions',
+    [ErrorSeverity.CRITICAL]: 'Critical file system error - restart required'
+  },
+  [ErrorCategory.API]: {
+    [ErrorSeverity.LOW]: 'API request completed with warnings',
+    [ErrorSeverity.MEDIUM]: 'API connection issue - retrying...',
+    [ErrorSeverity.HIGH]: 'API service unavailable - please try again',
+    [ErrorSeverity.CRITICAL]: 'API authentication failed - check license key'
+  },
+  [ErrorCategory.PREMIERE]: {
+    [ErrorSeverity.LOW]: 'Premiere operation completed with warnings',
+    [ErrorSeverity.MEDIUM]: 'Timeline sync issue - refreshing...',
+    [ErrorSeverity.HIGH]: 'Unable to communicate with Premiere Pro',
+    [ErrorSeverity.CRITICAL]: 'Premiere Pro connection lost - restart plugin'
+  },
+  [ErrorCategory.UI]: {
+    [ErrorSeverity.LOW]: 'Minor display issue',
+    [ErrorSeverity.MEDIUM]: 'Interface issue - please refresh',
+    [ErrorSeverity.HIGH]: 'UI error - some features may be unavailable',
+    [ErrorSeverity.CRITICAL]: 'Critical UI error - restart required'
+  },
+  [ErrorCategory.NETWORK]: {
+    [ErrorSeverity.LOW]: 'Network request completed with warnings',
+    [ErrorSeverity.MEDIUM]: 'Connection issue - retrying...',
+    [ErrorSeverity.HIGH]: 'Network unavailable - check connection',
+    [ErrorSeverity.CRITICAL]: 'Network error - service unavailable'
+  },
+  [ErrorCategory.VALIDATION]: {
+    [ErrorSeverity.LOW]: 'Input validation warning',
+    [ErrorSeverity.MEDIUM]: 'Invalid input - please check your data',
+    [ErrorSeverity.HIGH]: 'Validation failed - operation cancelled',
+    [ErrorSeverity.CRITICAL]: 'Critical validation error'
+  }
+};
+
 class ErrorManager {
   private errors: ErrorDetails[] = [];
   private notificationCallbacks: Set<(notification: NotificationOptions & { message: string; id: string }) => void> = new Set();
@@ -167,46 +208,7 @@ class ErrorManager {
   }
 
   private getDefaultUserMessage(category: ErrorCategory, severity: ErrorSeverity): string {
-    const messages = {
-      [ErrorCategory.FILE_SYSTEM]: {
-        [ErrorSeverity.LOW]: 'File operation completed with warnings',
-        [ErrorSeverity.MEDIUM]: 'File access issue - please check permissions',
-        [ErrorSeverity.HIGH]: 'Unable to access file system - check folder permissions',
-        [ErrorSeverity.CRITICAL]: 'Critical file system error - restart required'
-      },
-      [ErrorCategory.API]: {
-        [ErrorSeverity.LOW]: 'API request completed with warnings',
-        [ErrorSeverity.MEDIUM]: 'API connection issue - retrying...',
-        [ErrorSeverity.HIGH]: 'API service unavailable - please try again',
-        [ErrorSeverity.CRITICAL]: 'API authentication failed - check license key'
-      },
-      [ErrorCategory.PREMIERE]: {
-        [ErrorSeverity.LOW]: 'Premiere operation completed with warnings',
-        [ErrorSeverity.MEDIUM]: 'Timeline sync issue - refreshing...',
-        [ErrorSeverity.HIGH]: 'Unable to communicate with Premiere Pro',
-        [ErrorSeverity.CRITICAL]: 'Premiere Pro connection lost - restart plugin'
-      },
-      [ErrorCategory.UI]: {
-        [ErrorSeverity.LOW]: 'Minor display issue',
-        [ErrorSeverity.MEDIUM]: 'Interface issue - please refresh',
-        [ErrorSeverity.HIGH]: 'UI error - some features may be unavailable', 
-        [ErrorSeverity.CRITICAL]: 'Critical UI error - restart required'
-      },
-      [ErrorCategory.NETWORK]: {
-        [ErrorSeverity.LOW]: 'Network request completed with warnings',
-        [ErrorSeverity.MEDIUM]: 'Connection issue - retrying...',
-        [ErrorSeverity.HIGH]: 'Network unavailable - check connection',
-        [ErrorSeverity.CRITICAL]: 'Network error - service unavailable'
-      },
-      [ErrorCategory.VALIDATION]: {
-        [ErrorSeverity.LOW]: 'Input validation warning',
-        [ErrorSeverity.MEDIUM]: 'Invalid input - please check your data',
-        [ErrorSeverity.HIGH]: 'Validation failed - operation cancelled',
-        [ErrorSeverity.CRITICAL]: 'Critical validation error'
-      }
-    };
-
-    return messages[category]?.[severity] || 'An unexpected error occurred';
+    return DEFAULT_USER_MESSAGES[category]?.[severity] || 'An unexpected error occurred';
   }
 
   private logError(error: ErrorDetails) {
@@ -0,0 +1,76 @@
+/**
+ * Shared promise-based file system utilities for CEP panels
+ * Extracted from the per-file copies in main.tsx and useSFXFileManager
+ */
+
+import { fs } from './cep/node';
+
+export const fsAsync = {
+  existsSync: (path: string): boolean => {
+    try {
+      return fs.existsSync(path);
+    } catch {
+      return false;
+    }
+  },
+
+  // The async wrappers use the callback fs APIs so the IO actually runs on
+  // libuv's thread pool instead of blocking the UI thread for the syscall
+  exists: async (path: string): Promise<boolean> => {
+    return new Promise((resolve) => {
+      fs.access(path, (err: any) => resolve(!err));
+    });
+  },
+
+  readdir: async (path: string): Promise<string[]> => {
+    return new Promise((resolve, reject) => {
+      fs.readdir(path, (error: any, items: string[]) => {
+        if (error) {
+          reject(error);
+        } else {
+          // PERFORMANCE: Limit results - max 200 files per directory
+          resolve(items.slice(0, 200));
+        }
+      });
+    });
+  },
+
+  // Directory listing with entry types - lets walkers classify entries
+  // straight from the readdir results instead of a follow-up stat per item
+  readdirWithTypes: async (path: string): Promise<any[]> => {
+    return new Promise((resolve, reject) => {
+      fs.readdir(path, { withFileTypes: true }, (error: any, entries: any[]) => {
+        if (error) {
+          reject(error);
+        } else {
+          // PERFORMANCE: Limit results - max 200 files per directory
+          resolve(entries.slice(0, 200));
+        }
+      });
+    });
+  },
+
+  stat: async (path: string): Promise<any> => {
+    return new Promise((resolve, reject) => {
+      fs.stat(path, (error: any, stats: any) => {
+        if (error) {
+          reject(error);
+        } else {
+          resolve(stats);
+        }
+      });
+    });
+  },
+
+  mkdir: async (path: string, options?: { recursive?: boolean }): Promise<void> => {
+    return new Promise((resolve, reject) => {
+      fs.mkdir(path, options ?? {}, (error: any) => {
+        if (error) {
+          reject(error);
+        } else {
+          resolve();
+        }
+      });
+    });
+  }
+};
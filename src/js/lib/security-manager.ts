@@ -58,6 +58,17 @@ class SimpleEncryption {
  * Input sanitization utilities
  */
 export class InputSanitizer {
+  // Compiled once at class definition - sanitizePrompt runs on every
+  // search keystroke, so per-call regex literals add up
+  private static readonly PARENT_DIR_RE = /\.\./g;
+  private static readonly INVALID_PATH_CHARS_RE = /[<>:"|?*]/g;
+  private static readonly BACKSLASH_RE = /\\/g;
+  private static readonly INJECTION_CHARS_RE = /[<>{}]/g;
+  private static readonly WHITESPACE_RE = /\s+/g;
+  private static readonly EDGE_NONWORD_RE = /^\W+|\W+$/g;
+  private static readonly INVALID_FILENAME_CHARS_RE = /[<>:"/\\|?*\x00-\x1f]/g;
+  private static readonly API_KEY_FORMAT_RE = /^[a-zA-Z0-9_-]+$/;
+
   /**
    * Sanitize file paths to prevent directory traversal
    */
@@ -65,9 +76,9 @@ export class InputSanitizer {
     if (!path || typeof path !== 'string') return '';
     
     return path
-      .replace(/\.\./g, '') // Remove parent directory references
-      .replace(/[<>:"|?*]/g, '') // Remove invalid filename characters
-      .replace(/\\/g, '/') // Normalize path separators
+      .replace(InputSanitizer.PARENT_DIR_RE, '') // Remove parent directory references
+      .replace(InputSanitizer.INVALID_PATH_CHARS_RE, '') // Remove invalid filename characters
+      .replace(InputSanitizer.BACKSLASH_RE, '/') // Normalize path separators
       .trim();
   }
   
@@ -80,9 +91,9 @@ export class InputSanitizer {
     return prompt
       .trim()
       .substring(0, 500) // Limit length
-      .replace(/[<>{}]/g, '') // Remove potential code injection chars
-      .replace(/\s+/g, ' ') // Normalize whitespace
-      .replace(/^\W+|\W+$/g, ''); // Remove leading/trailing non-word chars
+      .replace(InputSanitizer.INJECTION_CHARS_RE, '') // Remove potential code injection chars
+      .replace(InputSanitizer.WHITESPACE_RE, ' ') // Normalize whitespace
+      .replace(InputSanitizer.EDGE_NONWORD_RE, ''); // Remove leading/trailing non-word chars
   }
   
   /**
@@ -115,7 +126,7 @@ export class InputSanitizer {
       return { valid: false, reason: 'API key too long' };
     }
     
-    if (!/^[a-zA-Z0-9_-]+$/.test(apiKey)) {
+    if (!InputSanitizer.API_KEY_FORMAT_RE.test(apiKey)) {
       return { valid: false, reason: 'API key contains invalid characters' };
     }
     
@@ -139,8 +150,8 @@ export class InputSanitizer {
     if (!filename || typeof filename !== 'string') return 'untitled';
     
     return filename
-      .replace(/[<>:"/\\|?*\x00-\x1f]/g, '') // Remove invalid chars
-      .replace(/\s+/g, '_') // Replace spaces with underscores
+      .replace(InputSanitizer.INVALID_FILENAME_CHARS_RE, '') // Remove invalid chars
+      .replace(InputSanitizer.WHITESPACE_RE, '_') // Replace spaces with underscores
       .substring(0, 100) // Limit length
       .trim();
   }
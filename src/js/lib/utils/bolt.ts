@@ -76,12 +76,7 @@ export const evalTS = <
   ...args: ArgTypes<Func>
 ): Promise<ReturnType<Func>> => {
   return new Promise(function (resolve, reject) {
-    const formattedArgs = args
-      .map((arg) => {
-        console.log(JSON.stringify(arg));
-        return `${JSON.stringify(arg)}`;
-      })
-      .join(",");
+    const formattedArgs = args.map((arg) => JSON.stringify(arg)).join(",");
     csi.evalScript(
       `try{
           var host = typeof $ !== 'undefined' ? $ : window;
@@ -114,12 +109,11 @@ export const evalTS = <
 };
 
 export const evalFile = (file: string) => {
+  // JSON-escape the path instead of splicing it raw into the script,
+  // so quotes and backslashes in extension paths can't break the eval
+  const safePath = JSON.stringify(file);
   return evalES(
-    "typeof $ !== 'undefined' ? $.evalFile(\"" +
-      file +
-      '") : fl.runScript(FLfile.platformPathToURI("' +
-      file +
-      '"));',
+    `typeof $ !== 'undefined' ? $.evalFile(${safePath}) : fl.runScript(FLfile.platformPathToURI(${safePath}));`,
     true
   );
 };
@@ -162,7 +156,6 @@ export const listenTS = <Key extends string & keyof EventTS>(
   isLocal = true
 ) => {
   const fullEvent = isLocal ? `${ns}.${event}` : event;
-  const csi = new CSInterface();
   // console.log(`listening to ${fullEvent}`);
   const thisCallback = (e: { data: EventTS[Key] }) => {
     callback(e.data);
@@ -27,29 +27,39 @@
   const targetUrl = urlMatch ? urlMatch[1] : window.location.href;
 
   let retryCount = 0;
-  const maxRetries = 120; // 2 minutes max
-  const retryInterval = 1000; // Check every second
+  const deadline = Date.now() + 120000; // 2 minutes max
+  const initialInterval = 50; // Start fast for quick dev-server boots
+  const maxInterval = 1000; // Back off to at most 1 check per second
+  let retryInterval = initialInterval;
 
   function tryReload() {
     retryCount++;
-    
+
     // Try to fetch the target URL
     fetch(targetUrl, { mode: 'no-cors' })
       .then(() => {
-        console.log('✅ Dev server is now available! Reloading...');
-        // Small delay to ensure server is fully ready
-        setTimeout(() => {
-          window.location.href = targetUrl;
-        }, 500);
+        console.log('✅ Dev server is now available! Confirming...');
+        // Confirm with a second probe instead of sleeping a blind 500ms -
+        // navigate the moment the server answers twice in a row, and fall
+        // back into the retry loop if the first answer was a fluke
+        fetch(targetUrl, { mode: 'no-cors' })
+          .then(() => {
+            window.location.href = targetUrl;
+          })
+          .catch(() => {
+            retryInterval = initialInterval;
+            setTimeout(tryReload, retryInterval);
+          });
       })
       .catch(() => {
-        if (retryCount < maxRetries) {
+        if (Date.now() < deadline) {
           // Show status to user
           if (retryCount % 5 === 0) {
-            console.log(`⏳ Waiting for dev server... (${retryCount}s)`);
+            console.log(`⏳ Waiting for dev server... (attempt ${retryCount})`);
           }
-          // Keep trying
+          // Keep trying with exponential backoff (50ms → 1s cap)
           setTimeout(tryReload, retryInterval);
+          retryInterval = Math.min(retryInterval * 1.5, maxInterval);
         } else {
           console.error('❌ Dev server did not start after 2 minutes');
           // Show user-friendly message
@@ -19,18 +19,54 @@ class ConnectionManager {
         this.intervalId = null;
         this.retryCount = 0;
         this.maxRetries = 3;
+
+        // Short-TTL cache so bursts of checks reuse the last probe result
+        this.lastCheckResult = null;
+        this.lastCheckTime = 0;
+        this.checkCacheTTL = 1500;
     }
     
     start() {
         console.log('🚀 Starting Smart Connection Manager...');
+        // Start in whichever mode worked last time so dev sessions don't
+        // bounce through the production build on every reload; the probe
+        // below corrects us if that memory is stale
+        this.isDevAvailable = this.getLastKnownMode() === 'dev';
+        this.loadApp();
+        this.startMonitoring();
+
         this.checkDevServer().then(available => {
-            this.isDevAvailable = available;
-            this.loadApp();
-            this.startMonitoring();
+            if (available !== this.isDevAvailable) {
+                console.log(`🔧 Dev server probe corrected mode: ${available ? 'dev' : 'prod'}`);
+                this.isDevAvailable = available;
+                this.loadApp();
+            }
         });
     }
+
+    getLastKnownMode() {
+        try {
+            return localStorage.getItem('connectionManagerMode');
+        } catch (e) {
+            return null;
+        }
+    }
+
+    rememberMode(mode) {
+        try {
+            localStorage.setItem('connectionManagerMode', mode);
+        } catch (e) {
+            // Ignore storage errors - we just fall back to prod next start
+        }
+    }
     
-    async checkDevServer() {
+    async checkDevServer(useCache = true) {
+        // Serve bursts from the cache instead of issuing a fresh HTTP probe
+        if (useCache && this.lastCheckResult !== null &&
+            Date.now() - this.lastCheckTime < this.checkCacheTTL) {
+            return this.lastCheckResult;
+        }
+
         try {
             console.log(`🔍 Checking dev server at ${this.devUrl}...`);
             
@@ -44,19 +80,25 @@ class ConnectionManager {
             });
             
             clearTimeout(timeoutId);
-            
+
             if (response.ok) {
                 console.log('✅ Dev server is available');
-                return true;
+                return this.recordCheckResult(true);
             } else {
                 console.log(`❌ Dev server returned ${response.status}`);
-                return false;
+                return this.recordCheckResult(false);
             }
         } catch (error) {
             console.log(`❌ Dev server check failed: ${error.message}`);
-            return false;
+            return this.recordCheckResult(false);
         }
     }
+
+    recordCheckResult(available) {
+        this.lastCheckResult = available;
+        this.lastCheckTime = Date.now();
+        return available;
+    }
     
     loadApp() {
         const container = document.getElementById(this.containerId);
@@ -83,6 +125,7 @@ class ConnectionManager {
     loadDevMode(container, indicator) {
         console.log('🔧 Loading in DEV MODE');
         this.currentMode = 'dev';
+        this.rememberMode('dev');
         
         // Update indicator
         indicator.textContent = 'DEV MODE';
@@ -103,6 +146,7 @@ class ConnectionManager {
     loadProdMode(container, indicator) {
         console.log('📦 Loading in PROD MODE');
         this.currentMode = 'prod';
+        this.rememberMode('prod');
         
         // Update indicator
         indicator.textContent = 'PROD MODE';
@@ -127,15 +171,22 @@ class ConnectionManager {
     }
     
     startMonitoring() {
-        // Only monitor if we're in production mode
-        // If dev server comes back online, we want to switch back
-        this.intervalId = setInterval(async () => {
+        // Adaptive re-probe instead of a fixed-rate interval: poll fast
+        // right after a mode switch (when the dev server is most likely
+        // mid-restart) and back off toward a ceiling while nothing changes
+        const maxDelay = this.checkInterval * 4;
+        let delay = this.checkInterval;
+
+        const tick = async () => {
+            let switched = false;
+
             if (this.currentMode === 'prod') {
                 const devAvailable = await this.checkDevServer();
                 if (devAvailable && !this.isDevAvailable) {
                     console.log('🔄 Dev server is back online, switching to dev mode');
                     this.isDevAvailable = true;
                     this.loadApp();
+                    switched = true;
                 }
             } else if (this.currentMode === 'dev') {
                 // Occasionally check if dev server is still alive
@@ -144,9 +195,15 @@ class ConnectionManager {
                     console.log('💥 Dev server went offline, switching to production mode');
                     this.isDevAvailable = false;
                     this.loadApp();
+                    switched = true;
                 }
             }
-        }, this.checkInterval);
+
+            delay = switched ? this.checkInterval : Math.min(delay * 1.5, maxDelay);
+            this.intervalId = setTimeout(tick, delay);
+        };
+
+        this.intervalId = setTimeout(tick, delay);
     }
     
     forceReload() {
@@ -182,7 +239,7 @@ class ConnectionManager {
     
     stop() {
         if (this.intervalId) {
-            clearInterval(this.intervalId);
+            clearTimeout(this.intervalId);
             this.intervalId = null;
         }
     }